@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -13,17 +14,39 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        # Loaded once via get_settings() and shared across threads; never mutated.
+        frozen=True,
     )
 
     openai_api_key: str = ""
 
     embedding_model: str = "text-embedding-3-small"
+    # Shorter text-embedding-3 vectors (e.g. 512): smaller index and cheaper similarity at a
+    # small recall cost. Unset keeps the model's native size; re-ingest after changing it.
+    embedding_dimensions: int | None = Field(default=None, ge=1)
     chat_model: str = "gpt-4o-mini"
     rag_top_k: int = 5
     # Hybrid: BM25 + HNSW vector. 1.0 = pure vector, 0.0 = pure keyword.
     rag_hybrid_alpha: float = Field(default=0.75, ge=0.0, le=1.0)
     # Comma-separated Weaviate property names for the BM25 leg (e.g. text,file_name).
     rag_hybrid_bm25_properties: str = "text"
+    # At most this many retrieved chunks go into the chat prompt; all hits are still returned
+    # as sources. Bounds prompt size (and formatting work) when callers ask for a large top_k.
+    rag_max_sources_in_prompt: int = Field(default=10, ge=1)
+    # Semantic answer cache: reuse an answer when a new question embeds this close to a
+    # previous one (cosine) and its retrieved chunks overlap the cached ones by at least
+    # rag_cache_min_overlap (Jaccard), so re-ingested or deleted content is not served.
+    # 0 entries disables it; the TTL is a backstop.
+    rag_cache_size: int = Field(default=256, ge=0)
+    rag_cache_similarity: float = Field(default=0.95, ge=0.0, le=1.0)
+    rag_cache_min_overlap: float = Field(default=0.6, ge=0.0, le=1.0)
+    rag_cache_ttl_seconds: float = Field(default=600.0, gt=0.0)
+    # Async API: concurrent question embeddings are sent as one batch, closed after this
+    # wait or once the batch reaches the token budget.
+    rag_embed_batch_wait_ms: float = Field(default=5.0, ge=0.0)
+    rag_embed_batch_max_tokens: int = Field(default=8000, ge=1)
+    # Exact-text LRU of question embeddings: repeated questions skip the OpenAI call.
+    rag_embedding_cache_size: int = Field(default=1024, ge=0)
 
     weaviate_http_host: str = "localhost"
     weaviate_http_port: int = 8080
@@ -33,6 +56,11 @@ class Settings(BaseSettings):
     weaviate_grpc_port: int = 50051
     weaviate_grpc_secure: bool = False
     weaviate_api_key: str | None = None
+    # HNSW vector compression for new collections: none (float32), sq (8-bit, ~4x smaller),
+    # bq (1-bit, ~32x) or pq. sq/pq train once enough vectors exist; originals stay on disk.
+    weaviate_vector_quantizer: Literal["none", "sq", "bq", "pq"] = "none"
+    # API server: background readiness probe of the shared client (never on the request path).
+    weaviate_health_check_seconds: float = Field(default=30.0, gt=0.0)
 
     # Default knowledge base: mapped to Weaviate class via library_class_name (see vectordb).
     collection_slug: str = "policy_documents"
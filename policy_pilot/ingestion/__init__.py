@@ -1,5 +1,28 @@
 """PDF loading, chunking, embedding, and Weaviate upsert."""
 
-from policy_pilot.ingestion.pipeline import ingest_pdf
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from policy_pilot.ingestion.pipeline import ingest_pdf
 
 __all__ = ["ingest_pdf"]
+
+# Resolved on first access so importing a submodule (e.g. chunking) does not pull in
+# pypdf and the Weaviate client.
+_LAZY = {"ingest_pdf": "policy_pilot.ingestion.pipeline"}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
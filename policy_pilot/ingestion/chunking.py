@@ -2,40 +2,53 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import tiktoken
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from policy_pilot.config import Settings
 
 
-def _encoding_for_embedding(model: str) -> tiktoken.Encoding:
+@lru_cache(maxsize=8)
+def encoding_for_embedding(model: str) -> tiktoken.Encoding:
     try:
         return tiktoken.encoding_for_model(model)
     except (KeyError, ValueError):
         return tiktoken.get_encoding("cl100k_base")
 
 
-def chunk_pages(
-    pages: list[tuple[int, str]],
-    settings: Settings,
-) -> list[tuple[int, int, str]]:
-    """Split pages into (page_number, chunk_index, text). Chunk index is per document, stable order."""
-    enc = _encoding_for_embedding(settings.embedding_model)
+@lru_cache(maxsize=8)
+def _splitter(model: str, chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+    # Built once per configuration; split_text keeps no state between calls.
+    enc = encoding_for_embedding(model)
 
     def length_fn(s: str) -> int:
-        return len(enc.encode(s))
+        # Plain text, no special-token checks: faster, and never raises on "<|endoftext|>".
+        return len(enc.encode_ordinary(s))
 
-    splitter = RecursiveCharacterTextSplitter(
-        chunk_size=settings.chunk_size_tokens,
-        chunk_overlap=settings.chunk_overlap_tokens,
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
         length_function=length_fn,
         separators=["\n\n", "\n", ". ", " ", ""],
+        # Pieces come back stripped (and empty ones dropped); chunk_pages relies on this.
+        strip_whitespace=True,
+    )
+
+
+def chunk_pages(
+    pages: list[tuple[int, str]],
+    settings: Settings,
+) -> list[tuple[int, int, str]]:
+    """Split pages into (page_number, chunk_index, text). Chunk index is per document, stable order."""
+    splitter = _splitter(
+        settings.embedding_model, settings.chunk_size_tokens, settings.chunk_overlap_tokens
     )
     out: list[tuple[int, int, str]] = []
     i = 0
     for page_num, text in pages:
         for piece in splitter.split_text(text):
-            piece = piece.strip()
             if piece:
                 out.append((page_num, i, piece))
                 i += 1
@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from langchain_openai import OpenAIEmbeddings
 
 from policy_pilot.config import get_settings
 
 
+@lru_cache(maxsize=1)
 def get_embedding_model() -> OpenAIEmbeddings:
+    """Process-wide client so HTTP connection pools are reused across calls."""
     s = get_settings()
     if not s.openai_api_key:
         raise ValueError("OPENAI_API_KEY is not set (required for embeddings).")
-    return OpenAIEmbeddings(api_key=s.openai_api_key, model=s.embedding_model)
+    return OpenAIEmbeddings(
+        api_key=s.openai_api_key, model=s.embedding_model, dimensions=s.embedding_dimensions
+    )
 
 
 def embed_texts(texts: list[str]) -> list[list[float]]:
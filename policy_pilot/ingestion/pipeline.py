@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from weaviate.classes.data import DataObject
@@ -42,7 +43,8 @@ def ingest_pdf(
     if not rows:
         raise ValueError(f"No chunks produced from {path}")
 
-    texts = [t for _, _, t in rows]
+    # Identical for every chunk of this PDF: built once, merged into each object.
+    doc_props = {"source_file": str(path), "file_name": path.name, "source": "pdf"}
 
     client = connect_weaviate()
     try:
@@ -54,27 +56,33 @@ def ingest_pdf(
 
         collection = client.collections.get(class_name)
         inserted = 0
-        for start in range(0, len(texts), batch_size):
-            batch_texts = texts[start : start + batch_size]
-            batch_rows = rows[start : start + batch_size]
-            vectors = embed_texts(batch_texts)
-            objects: list[DataObject] = []
-            for (page_num, chunk_index, text), vec in zip(batch_rows, vectors, strict=True):
-                objects.append(
-                    DataObject(
-                        properties={
-                            "text": text,
-                            "source_file": str(path),
-                            "file_name": path.name,
-                            "page": page_num,
-                            "chunk_index": chunk_index,
-                            "source": "pdf",
-                        },
-                        vector=vec,
+        # One-batch lookahead: embed the next batch (OpenAI) while this one is written
+        # to Weaviate, so the two round-trips overlap instead of adding up.
+        batches = (rows[start : start + batch_size] for start in range(0, len(rows), batch_size))
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            batch_rows = next(batches)
+            pending = pool.submit(embed_texts, [t for _, _, t in batch_rows])
+            while batch_rows:
+                vectors = pending.result()
+                next_rows = next(batches, [])
+                if next_rows:
+                    pending = pool.submit(embed_texts, [t for _, _, t in next_rows])
+                objects: list[DataObject] = []
+                for (page_num, chunk_index, text), vec in zip(batch_rows, vectors, strict=True):
+                    objects.append(
+                        DataObject(
+                            properties={
+                                **doc_props,
+                                "text": text,
+                                "page": page_num,
+                                "chunk_index": chunk_index,
+                            },
+                            vector=vec,
+                        )
                     )
-                )
-            collection.data.insert_many(objects)
-            inserted += len(objects)
+                collection.data.insert_many(objects)
+                inserted += len(objects)
+                batch_rows = next_rows
         return inserted
     finally:
         client.close()
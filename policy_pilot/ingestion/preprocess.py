@@ -5,11 +5,16 @@ from __future__ import annotations
 import re
 import unicodedata
 
+_BLANK_RUNS = re.compile(r"\n{3,}")
+
 
 def normalize_text(text: str) -> str:
     if not text:
         return ""
-    text = unicodedata.normalize("NFC", text)
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    # Extracted PDF text is usually NFC already with \n line ends; skip those copies then.
+    if not unicodedata.is_normalized("NFC", text):
+        text = unicodedata.normalize("NFC", text)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = _BLANK_RUNS.sub("\n\n", text)
     return text.strip()
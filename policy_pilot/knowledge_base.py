@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from policy_pilot.vectordb import connect_weaviate, list_collection_names
+from policy_pilot.vectordb import get_shared_client, list_collection_names
 
 
 def list_knowledge_bases() -> list[str]:
@@ -12,8 +12,4 @@ def list_knowledge_bases() -> list[str]:
     Ingest writes here via ``ingest_pdf`` (class name from ``library_class_name``).
     Any collection with the same chunk properties can be queried.
     """
-    client = connect_weaviate()
-    try:
-        return list_collection_names(client)
-    finally:
-        client.close()
+    return list_collection_names(get_shared_client())
@@ -1,6 +1,33 @@
 """Retrieval and generation (LangChain-style; extend with LangGraph later)."""
 
-from policy_pilot.rag.retriever import ChunkMetadataFilter
-from policy_pilot.rag.service import query_rag
+from __future__ import annotations
 
-__all__ = ["query_rag", "ChunkMetadataFilter"]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from policy_pilot.rag.retriever import ChunkMetadataFilter
+    from policy_pilot.rag.service import aquery_rag, query_rag
+
+__all__ = ["query_rag", "aquery_rag", "ChunkMetadataFilter"]
+
+# Resolved on first access so importing a submodule (e.g. cache) does not pull in
+# LangChain/OpenAI and the Weaviate client.
+_LAZY = {
+    "query_rag": "policy_pilot.rag.service",
+    "aquery_rag": "policy_pilot.rag.service",
+    "ChunkMetadataFilter": "policy_pilot.rag.retriever",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,117 @@
+"""Coalesce concurrent query embeddings into batched OpenAI requests."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable
+
+
+class QueryEmbeddingBatcher:
+    """
+    Micro-batch ``embed`` calls made from concurrent requests on one event loop.
+
+    The first queued text opens a batch; it closes after ``max_wait_ms`` or once the
+    summed token count reaches ``max_tokens``, then one ``embed_many`` call resolves
+    every waiter. Errors propagate to all callers in the failed batch, and every caller
+    is resolved or failed even if the worker is cancelled. Moving to a new loop (or
+    ``close``) fails anything still queued for the old worker.
+    """
+
+    def __init__(
+        self,
+        embed_many: Callable[[list[str]], Awaitable[list[list[float]]]],
+        count_tokens: Callable[[str], int],
+        *,
+        max_wait_ms: float,
+        max_tokens: int,
+    ) -> None:
+        self._embed_many = embed_many
+        self._count_tokens = count_tokens
+        self._max_wait = max_wait_ms / 1000.0
+        self._max_tokens = max_tokens
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[tuple[str, int, asyncio.Future[list[float]]]] | None = None
+        self._worker: asyncio.Task[None] | None = None
+
+    def _stop(self, exc: BaseException) -> None:
+        """Cancel the current worker and fail whatever is still queued for it with ``exc``."""
+        loop, queue, worker = self._loop, self._queue, self._worker
+        self._loop = self._queue = self._worker = None
+        if loop is None or queue is None:
+            return
+        if worker is not None and not worker.done():
+            # The worker may belong to a loop running in another thread, or to a closed one.
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(worker.cancel)
+        while not queue.empty():
+            _, _, fut = queue.get_nowait()
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(_fail, fut, exc)
+
+    def _ensure_worker(self) -> asyncio.Queue[tuple[str, int, asyncio.Future[list[float]]]]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._stop(RuntimeError("query embedding batcher restarted"))
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+        assert self._queue is not None
+        return self._queue
+
+    async def embed(self, text: str) -> list[float]:
+        queue = self._ensure_worker()
+        fut: asyncio.Future[list[float]] = asyncio.get_running_loop().create_future()
+        queue.put_nowait((text, self._count_tokens(text), fut))
+        return await fut
+
+    async def close(self) -> None:
+        """Stop the worker and fail queued callers; a later ``embed`` starts a new one."""
+        worker = self._worker
+        owned = self._loop is asyncio.get_running_loop()
+        self._stop(RuntimeError("query embedding batcher closed"))
+        if owned and worker is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+
+    async def _run(
+        self, queue: asyncio.Queue[tuple[str, int, asyncio.Future[list[float]]]]
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            first = await queue.get()
+            batch = [first]
+            try:
+                tokens = first[1]
+                deadline = loop.time() + self._max_wait
+                while tokens < self._max_tokens:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    batch.append(item)
+                    tokens += item[1]
+
+                vectors = await self._embed_many([text for text, _, _ in batch])
+                if len(vectors) != len(batch):
+                    raise RuntimeError(
+                        f"Embedding returned {len(vectors)} vectors for {len(batch)} texts"
+                    )
+                for (_, _, fut), vec in zip(batch, vectors, strict=True):
+                    if not fut.done():
+                        fut.set_result(vec)
+            except Exception as exc:
+                for _, _, fut in batch:
+                    _fail(fut, exc)
+            finally:
+                # Only reached with pending futures when the worker itself is cancelled.
+                for _, _, fut in batch:
+                    _fail(fut, RuntimeError("query embedding batcher stopped"))
+
+
+def _fail(fut: asyncio.Future[list[float]], exc: BaseException) -> None:
+    if not fut.done():
+        fut.set_exception(exc)
@@ -0,0 +1,274 @@
+"""Semantic answer cache: reuse RAG results for near-duplicate questions."""
+
+from __future__ import annotations
+
+import copy
+import heapq
+import math
+import operator
+import random
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class _Entry:
+    scope: tuple[Any, ...]
+    # float32: a quarter of the memory of a list of Python floats for the same vector.
+    vector: array[float]
+    signatures: list[int]
+    chunk_keys: frozenset[Any]
+    result: dict[str, Any]
+    expires_at: float
+    referenced: bool = False
+
+
+def _dot(a: Sequence[float], b: Sequence[float]) -> float:
+    # map(operator.mul) keeps the multiply-accumulate loop in C (no generator frame per item).
+    return sum(map(operator.mul, a, b))
+
+
+def _cosine(a: Sequence[float], b: Sequence[float]) -> float:
+    dot = _dot(a, b)
+    na = math.sqrt(_dot(a, a))
+    nb = math.sqrt(_dot(b, b))
+    if na == 0.0 or nb == 0.0:
+        return 0.0
+    return dot / (na * nb)
+
+
+def _jaccard(a: frozenset[Any], b: frozenset[Any]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class SemanticAnswerCache:
+    """
+    Bounded cache of RAG results, looked up by cosine similarity of question embeddings.
+
+    Random-hyperplane LSH (``n_tables`` tables of ``n_planes`` sign bits) narrows a probe
+    to entries likely to be similar; candidates are then checked against ``threshold``.
+    ``scope`` (collection, k, filter) must match exactly, and the chunks retrieved for
+    the new question must overlap the cached answer's chunks by at least ``min_overlap``
+    (Jaccard), so answers grounded in re-ingested or deleted content are not served.
+    ``ttl_seconds`` bounds the lifetime of every entry as a backstop. Results are deep
+    copied on the way in and out. Eviction approximates LRU with CLOCK (second chance),
+    so a hit only sets a reference bit. With ``normalized=True`` callers promise
+    unit-length vectors (OpenAI embeddings are), so cosine is a plain dot.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        threshold: float,
+        min_overlap: float,
+        ttl_seconds: float,
+        *,
+        n_tables: int = 4,
+        n_planes: int = 8,
+        seed: int = 0,
+        normalized: bool = False,
+    ) -> None:
+        self.max_size = max_size
+        self.threshold = threshold
+        self.min_overlap = min_overlap
+        self.ttl_seconds = ttl_seconds
+        self._n_tables = n_tables
+        self._n_planes = n_planes
+        self._similarity = _dot if normalized else _cosine
+        self._rng = random.Random(seed)
+        self._planes: list[list[list[float]]] | None = None
+        # Insertion-ordered: the CLOCK hand starts at the first key.
+        self._entries: dict[int, _Entry] = {}
+        self._buckets: list[dict[int, set[int]]] = [{} for _ in range(n_tables)]
+        # (expires_at, entry_id) min-heap so expired entries are purged without a scan.
+        self._expiry: list[tuple[float, int]] = []
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def _signatures(self, vector: list[float]) -> list[int]:
+        # Pure arithmetic on immutable planes: callers run this outside the lock.
+        all_planes = self._planes
+        if all_planes is None:
+            with self._lock:
+                if self._planes is None:
+                    dim = len(vector)
+                    self._planes = [
+                        [
+                            [self._rng.gauss(0.0, 1.0) for _ in range(dim)]
+                            for _ in range(self._n_planes)
+                        ]
+                        for _ in range(self._n_tables)
+                    ]
+                all_planes = self._planes
+        sigs: list[int] = []
+        for planes in all_planes:
+            sig = 0
+            for bit, plane in enumerate(planes):
+                if _dot(plane, vector) >= 0.0:
+                    sig |= 1 << bit
+            sigs.append(sig)
+        return sigs
+
+    def _remove(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id)
+        for table, sig in zip(self._buckets, entry.signatures, strict=True):
+            bucket = table.get(sig)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del table[sig]
+
+    def get(
+        self, scope: tuple[Any, ...], vector: list[float], chunk_keys: frozenset[Any]
+    ) -> dict[str, Any] | None:
+        sigs = self._signatures(vector)
+        now = time.monotonic()
+        # Hold the lock only to snapshot candidates; similarity is scored outside it so
+        # concurrent probes do not serialize on the vector math.
+        with self._lock:
+            ids: set[int] = set()
+            for table, sig in zip(self._buckets, sigs, strict=True):
+                ids |= table.get(sig, set())
+            candidates: list[_Entry] = []
+            for entry_id in ids:
+                entry = self._entries[entry_id]
+                if entry.expires_at <= now:
+                    self._remove(entry_id)
+                elif entry.scope == scope:
+                    candidates.append(entry)
+
+        best: _Entry | None = None
+        best_sim = self.threshold
+        for entry in candidates:
+            if _jaccard(chunk_keys, entry.chunk_keys) < self.min_overlap:
+                continue
+            sim = self._similarity(vector, entry.vector)
+            if sim >= best_sim:
+                best, best_sim = entry, sim
+        if best is None:
+            return None
+        best.referenced = True
+        # Stored results are never mutated, so copying outside the lock is safe.
+        return copy.deepcopy(best.result)
+
+    def put(
+        self,
+        scope: tuple[Any, ...],
+        vector: list[float],
+        chunk_keys: frozenset[Any],
+        result: dict[str, Any],
+    ) -> None:
+        if self.max_size <= 0:
+            return
+        sigs = self._signatures(vector)
+        now = time.monotonic()
+        with self._lock:
+            self._purge_expired(now)
+            # Make room first so the new (unreferenced) entry is not the CLOCK victim.
+            overflow = len(self._entries) + 1 - self.max_size
+            if overflow > 0:
+                self._evict(overflow)
+            entry_id = self._next_id
+            self._next_id += 1
+            expires_at = now + self.ttl_seconds
+            self._entries[entry_id] = _Entry(
+                scope=scope,
+                vector=array("f", vector),
+                signatures=sigs,
+                chunk_keys=frozenset(chunk_keys),
+                result=copy.deepcopy(result),
+                expires_at=expires_at,
+            )
+            heapq.heappush(self._expiry, (expires_at, entry_id))
+            self._compact_expiry()
+            for table, sig in zip(self._buckets, sigs, strict=True):
+                table.setdefault(sig, set()).add(entry_id)
+
+    def _purge_expired(self, now: float) -> None:
+        heap = self._expiry
+        while heap and heap[0][0] <= now:
+            _, entry_id = heapq.heappop(heap)
+            # Entries evicted or purged by a probe leave stale heap records; skip them.
+            if entry_id in self._entries:
+                self._remove(entry_id)
+
+    def _compact_expiry(self) -> None:
+        # Evicted entries leave their records behind until they would have expired; once
+        # those outnumber the live ones, rebuild the heap so it stays O(max_size).
+        if len(self._expiry) > 2 * len(self._entries):
+            self._expiry = [(e.expires_at, entry_id) for entry_id, e in self._entries.items()]
+            heapq.heapify(self._expiry)
+
+    def _evict(self, count: int) -> None:
+        # CLOCK: referenced entries get a second chance (bit cleared, rotated to the back).
+        # Each pass walks one snapshot of the ring; a second pass is only needed when
+        # every entry in the first was referenced.
+        while count > 0:
+            for entry_id in list(self._entries):
+                entry = self._entries[entry_id]
+                if entry.referenced:
+                    entry.referenced = False
+                    del self._entries[entry_id]
+                    self._entries[entry_id] = entry
+                    continue
+                self._remove(entry_id)
+                count -= 1
+                if count == 0:
+                    return
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._expiry.clear()
+            for table in self._buckets:
+                table.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class EmbeddingLRU:
+    """
+    Bounded exact-text map from question to embedding, evicting least recently used.
+
+    Keys are the raw text; callers own one instance per embedding model/dimension, so
+    vectors from different models never mix. Vectors are held as float32 arrays and
+    handed back as fresh lists.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._vectors: OrderedDict[str, array[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, text: str) -> list[float] | None:
+        with self._lock:
+            vector = self._vectors.get(text)
+            if vector is None:
+                return None
+            self._vectors.move_to_end(text)
+        return vector.tolist()
+
+    def put(self, text: str, vector: list[float]) -> None:
+        if self.max_size <= 0:
+            return
+        packed = array("f", vector)
+        with self._lock:
+            self._vectors[text] = packed
+            self._vectors.move_to_end(text)
+            while len(self._vectors) > self.max_size:
+                self._vectors.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._vectors.clear()
+
+    def __len__(self) -> int:
+        return len(self._vectors)
@@ -44,6 +44,45 @@ def _weaviate_filter(meta: ChunkMetadataFilter | None) -> Any | None:
     return out
 
 
+def _hybrid_kwargs(
+    *,
+    query_text: str,
+    query_vector: list[float],
+    limit: int,
+    alpha: float,
+    bm25_properties: list[str] | None,
+    metadata_filter: ChunkMetadataFilter | None,
+    return_scores: bool,
+) -> dict[str, Any]:
+    qp = (
+        bm25_properties
+        if bm25_properties
+        else ["text"]
+    )
+    return {
+        "query": query_text,
+        "vector": query_vector,
+        "alpha": alpha,
+        "query_properties": qp,
+        "limit": limit,
+        "filters": _weaviate_filter(metadata_filter),
+        "return_properties": PROP_NAMES,
+        "return_metadata": MetadataQuery(score=True, distance=True) if return_scores else None,
+    }
+
+
+def _hits_from_response(response: Any, return_scores: bool) -> list[dict[str, Any]]:
+    hits: list[dict[str, Any]] = []
+    for obj in response.objects:
+        props = obj.properties or {}
+        row: dict[str, Any] = {k: props.get(k) for k in PROP_NAMES}
+        if return_scores and obj.metadata is not None:
+            row["score"] = obj.metadata.score
+            row["distance"] = obj.metadata.distance
+        hits.append(row)
+    return hits
+
+
 def search_chunks(
     client: weaviate.WeaviateClient,
     class_name: str,
@@ -62,31 +101,43 @@ def search_chunks(
     The query text drives keyword relevance; ``query_vector`` drives semantic neighbors.
     """
     collection = client.collections.get(class_name)
-    qp = (
-        bm25_properties
-        if bm25_properties
-        else ["text"]
-    )
-    filters = _weaviate_filter(metadata_filter)
-    meta = MetadataQuery(score=True, distance=True) if return_scores else None
-
     response = collection.query.hybrid(
-        query=query_text,
-        vector=query_vector,
-        alpha=alpha,
-        query_properties=qp,
-        limit=limit,
-        filters=filters,
-        return_properties=PROP_NAMES,
-        return_metadata=meta,
+        **_hybrid_kwargs(
+            query_text=query_text,
+            query_vector=query_vector,
+            limit=limit,
+            alpha=alpha,
+            bm25_properties=bm25_properties,
+            metadata_filter=metadata_filter,
+            return_scores=return_scores,
+        )
     )
+    return _hits_from_response(response, return_scores)
 
-    hits: list[dict[str, Any]] = []
-    for obj in response.objects:
-        props = obj.properties or {}
-        row: dict[str, Any] = {k: props.get(k) for k in PROP_NAMES}
-        if return_scores and obj.metadata is not None:
-            row["score"] = obj.metadata.score
-            row["distance"] = obj.metadata.distance
-        hits.append(row)
-    return hits
+
+async def asearch_chunks(
+    client: weaviate.WeaviateAsyncClient,
+    class_name: str,
+    *,
+    query_text: str,
+    query_vector: list[float],
+    limit: int,
+    alpha: float = 0.75,
+    bm25_properties: list[str] | None = None,
+    metadata_filter: ChunkMetadataFilter | None = None,
+    return_scores: bool = True,
+) -> list[dict[str, Any]]:
+    """``search_chunks`` over the async client (no worker thread on the event loop)."""
+    collection = client.collections.get(class_name)
+    response = await collection.query.hybrid(
+        **_hybrid_kwargs(
+            query_text=query_text,
+            query_vector=query_vector,
+            limit=limit,
+            alpha=alpha,
+            bm25_properties=bm25_properties,
+            metadata_filter=metadata_filter,
+            return_scores=return_scores,
+        )
+    )
+    return _hits_from_response(response, return_scores)
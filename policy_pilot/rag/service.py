@@ -2,53 +2,237 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from dataclasses import astuple
+from functools import lru_cache
 from typing import Any
 
+import weaviate
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from langchain_openai import ChatOpenAI
 
 from policy_pilot.config import Settings, get_settings
-from policy_pilot.rag.retriever import ChunkMetadataFilter, search_chunks
-from policy_pilot.vectordb import connect_weaviate, library_class_name
+from policy_pilot.ingestion.chunking import encoding_for_embedding
+from policy_pilot.ingestion.embeddings import get_embedding_model
+from policy_pilot.rag.batching import QueryEmbeddingBatcher
+from policy_pilot.rag.cache import EmbeddingLRU, SemanticAnswerCache
+from policy_pilot.rag.retriever import ChunkMetadataFilter, asearch_chunks, search_chunks
+from policy_pilot.vectordb import (
+    get_shared_async_client,
+    get_shared_client,
+    library_class_name,
+)
 
 
-def _bm25_property_list(s: Settings) -> list[str]:
-    props = [p.strip() for p in s.rag_hybrid_bm25_properties.split(",") if p.strip()]
+@lru_cache(maxsize=8)
+def _parse_bm25_properties(raw: str) -> list[str]:
+    props = [p.strip() for p in raw.split(",") if p.strip()]
     return props if props else ["text"]
 
 
-def _retrieve_hits(
+def _bm25_property_list(s: Settings) -> list[str]:
+    # Parsed once per distinct setting value; callers must not mutate the result.
+    return _parse_bm25_properties(s.rag_hybrid_bm25_properties)
+
+
+# Misses only: a missing collection is re-checked at most once per TTL, so repeated
+# queries against it skip the Weaviate round-trip. Existing collections are always
+# checked, so a deleted one still gets the clear "does not exist" error.
+_MISSING_TTL_SECONDS = 5.0
+_MISSING_CACHE_MAX = 256
+_missing_until: dict[str, float] = {}
+
+
+def _known_missing(class_name: str) -> bool:
+    until = _missing_until.get(class_name)
+    return until is not None and until > time.monotonic()
+
+
+def _remember_missing(class_name: str) -> None:
+    if len(_missing_until) >= _MISSING_CACHE_MAX:
+        # Names come from request bodies; keep the table bounded.
+        _missing_until.clear()
+    _missing_until[class_name] = time.monotonic() + _MISSING_TTL_SECONDS
+
+
+def _missing_collection(class_name: str) -> ValueError:
+    return ValueError(f"Weaviate collection {class_name!r} does not exist. Ingest a PDF first.")
+
+
+def _search_hits(
     s: Settings,
     question: str,
+    qvec: list[float],
     class_name: str,
     k: int,
     metadata_filter: ChunkMetadataFilter | None = None,
 ) -> list[dict[str, Any]]:
-    embedder = OpenAIEmbeddings(api_key=s.openai_api_key, model=s.embedding_model)
-    qvec = embedder.embed_query(question)
-    client = connect_weaviate()
-    try:
-        if not client.collections.exists(class_name):
-            raise ValueError(
-                f"Weaviate collection {class_name!r} does not exist. Ingest a PDF first."
-            )
-        return search_chunks(
-            client,
-            class_name,
-            query_text=question,
-            query_vector=qvec,
-            limit=k,
-            alpha=s.rag_hybrid_alpha,
-            bm25_properties=_bm25_property_list(s),
-            metadata_filter=metadata_filter,
-        )
-    finally:
-        client.close()
+    if _known_missing(class_name):
+        raise _missing_collection(class_name)
+    client = get_shared_client()
+    if not client.collections.exists(class_name):
+        _remember_missing(class_name)
+        raise _missing_collection(class_name)
+    return search_chunks(
+        client,
+        class_name,
+        query_text=question,
+        query_vector=qvec,
+        limit=k,
+        alpha=s.rag_hybrid_alpha,
+        bm25_properties=_bm25_property_list(s),
+        metadata_filter=metadata_filter,
+    )
+
+
+async def _acollection_client(class_name: str) -> weaviate.WeaviateAsyncClient:
+    if _known_missing(class_name):
+        raise _missing_collection(class_name)
+    client = await get_shared_async_client()
+    if not await client.collections.exists(class_name):
+        _remember_missing(class_name)
+        raise _missing_collection(class_name)
+    return client
+
+
+async def _asearch_hits(
+    s: Settings,
+    client: weaviate.WeaviateAsyncClient,
+    question: str,
+    qvec: list[float],
+    class_name: str,
+    k: int,
+    metadata_filter: ChunkMetadataFilter | None = None,
+) -> list[dict[str, Any]]:
+    return await asearch_chunks(
+        client,
+        class_name,
+        query_text=question,
+        query_vector=qvec,
+        limit=k,
+        alpha=s.rag_hybrid_alpha,
+        bm25_properties=_bm25_property_list(s),
+        metadata_filter=metadata_filter,
+    )
+
+
+@lru_cache(maxsize=1)
+def _answer_cache() -> SemanticAnswerCache | None:
+    s = get_settings()
+    if s.rag_cache_size <= 0:
+        return None
+    # OpenAI embeddings are unit-length, so the cache can skip the norm computations.
+    return SemanticAnswerCache(
+        s.rag_cache_size,
+        s.rag_cache_similarity,
+        s.rag_cache_min_overlap,
+        s.rag_cache_ttl_seconds,
+        normalized=True,
+    )
+
+
+@lru_cache(maxsize=1)
+def _query_batcher() -> QueryEmbeddingBatcher:
+    s = get_settings()
+    enc = encoding_for_embedding(s.embedding_model)
+    return QueryEmbeddingBatcher(
+        get_embedding_model().aembed_documents,
+        lambda text: len(enc.encode_ordinary(text)),
+        max_wait_ms=s.rag_embed_batch_wait_ms,
+        max_tokens=s.rag_embed_batch_max_tokens,
+    )
+
+
+async def close_query_batcher() -> None:
+    """Stop the query-embedding batch worker (FastAPI shutdown)."""
+    if _query_batcher.cache_info().currsize:
+        await _query_batcher().close()
+
+
+@lru_cache(maxsize=1)
+def _embedding_cache() -> EmbeddingLRU | None:
+    # Settings are frozen, so one instance always holds vectors from a single model.
+    size = get_settings().rag_embedding_cache_size
+    return EmbeddingLRU(size) if size > 0 else None
+
+
+def _embed_question(question: str) -> list[float]:
+    cache = _embedding_cache()
+    if cache is not None and (qvec := cache.get(question)) is not None:
+        return qvec
+    qvec = get_embedding_model().embed_query(question)
+    if cache is not None:
+        cache.put(question, qvec)
+    return qvec
+
+
+async def _aembed_question(question: str) -> list[float]:
+    cache = _embedding_cache()
+    if cache is not None and (qvec := cache.get(question)) is not None:
+        return qvec
+    qvec = await _query_batcher().embed(question)
+    if cache is not None:
+        cache.put(question, qvec)
+    return qvec
+
+
+def _cache_scope(
+    class_name: str, k: int, metadata_filter: ChunkMetadataFilter | None
+) -> tuple[Any, ...]:
+    meta = astuple(metadata_filter) if metadata_filter is not None else None
+    return (class_name, k, meta)
+
+
+def _chunk_keys(hits: list[dict[str, Any]]) -> frozenset[tuple[Any, ...]]:
+    # Location plus text: re-ingested or edited chunks get new keys, so answers grounded in
+    # the old content stop matching.
+    return frozenset(
+        (h.get("source_file"), h.get("page"), h.get("chunk_index"), h.get("text")) for h in hits
+    )
+
+
+def _cached_answer(
+    scope: tuple[Any, ...], qvec: list[float], chunks: frozenset[tuple[Any, ...]]
+) -> dict[str, Any] | None:
+    cache = _answer_cache()
+    return cache.get(scope, qvec, chunks) if cache is not None else None
+
+
+def _remember_answer(
+    scope: tuple[Any, ...],
+    qvec: list[float],
+    chunks: frozenset[tuple[Any, ...]],
+    out: dict[str, Any],
+) -> None:
+    cache = _answer_cache()
+    if cache is not None:
+        cache.put(scope, qvec, chunks, out)
 
 
-def _context_from_hits(hits: list[dict[str, Any]]) -> str:
+def _resolve_target(
+    s: Settings,
+    collection_slug: str | None,
+    weaviate_class_name: str | None,
+    top_k: int | None,
+) -> tuple[str, int]:
+    """Validate settings and return the Weaviate class name and ``k`` for a query."""
+    if not s.openai_api_key:
+        raise ValueError("OPENAI_API_KEY is not set.")
+
+    direct = (weaviate_class_name or "").strip()
+    if direct:
+        class_name = direct
+    else:
+        slug = collection_slug or s.collection_slug
+        class_name = library_class_name(slug)
+    k = top_k if top_k is not None else s.rag_top_k
+    return class_name, k
+
+
+def _context_from_hits(hits: list[dict[str, Any]], max_sources: int) -> str:
     blocks: list[str] = []
-    for i, h in enumerate(hits, start=1):
+    for i, h in enumerate(hits[:max_sources], start=1):
         text = h.get("text") or ""
         score = h.get("score")
         score_bit = f", score={score:.4f}" if isinstance(score, (int, float)) else ""
@@ -60,23 +244,44 @@ def _context_from_hits(hits: list[dict[str, Any]]) -> str:
     return "\n\n".join(blocks) if blocks else "(no retrieved context)"
 
 
-def _answer_from_context(s: Settings, question: str, context: str) -> str:
-    llm = ChatOpenAI(
+@lru_cache(maxsize=1)
+def _chat_model() -> ChatOpenAI:
+    s = get_settings()
+    return ChatOpenAI(
         api_key=s.openai_api_key,
         model=s.chat_model,
         temperature=0.2,
     )
-    system = (
+
+
+# Invariant across requests: built once and shared (messages are not mutated by invoke).
+_SYSTEM_MESSAGE = SystemMessage(
+    content=(
         "You are a careful policy assistant. Answer using only the provided context. "
         "If the context is insufficient, say so. Cite snippet numbers [1], [2] when relevant."
     )
+)
+
+
+def _chat_messages(question: str, context: str) -> list[SystemMessage | HumanMessage]:
     user = f"Context:\n{context}\n\nQuestion: {question}"
-    msg = llm.invoke(
-        [SystemMessage(content=system), HumanMessage(content=user)],
-    )
+    return [_SYSTEM_MESSAGE, HumanMessage(content=user)]
+
+
+def _message_text(msg: Any) -> str:
     return msg.content if isinstance(msg.content, str) else str(msg.content)
 
 
+def _answer_from_context(question: str, context: str) -> str:
+    msg = _chat_model().invoke(_chat_messages(question, context))
+    return _message_text(msg)
+
+
+async def _aanswer_from_context(question: str, context: str) -> str:
+    msg = await _chat_model().ainvoke(_chat_messages(question, context))
+    return _message_text(msg)
+
+
 def query_rag(
     question: str,
     *,
@@ -92,21 +297,57 @@ def query_rag(
     (for data already in the vector DB). Otherwise ``collection_slug`` is mapped with
     ``library_class_name`` (same as ingest).
 
+    Near-duplicate questions against the same collection, ``k`` and filter reuse a cached
+    answer (skipping the chat call) when their retrieved chunks still largely match the
+    ones it was generated from (see ``rag_cache_*`` settings).
+
     Returns ``{"answer": str, "sources": list[dict]}``.
     """
     s = get_settings()
-    if not s.openai_api_key:
-        raise ValueError("OPENAI_API_KEY is not set.")
+    class_name, k = _resolve_target(s, collection_slug, weaviate_class_name, top_k)
 
-    direct = (weaviate_class_name or "").strip()
-    if direct:
-        class_name = direct
-    else:
-        slug = collection_slug or s.collection_slug
-        class_name = library_class_name(slug)
-    k = top_k if top_k is not None else s.rag_top_k
+    qvec = _embed_question(question)
+    hits = _search_hits(s, question, qvec, class_name, k, metadata_filter)
+    scope = _cache_scope(class_name, k, metadata_filter)
+    chunks = _chunk_keys(hits)
+    if (cached := _cached_answer(scope, qvec, chunks)) is not None:
+        return cached
+
+    context = _context_from_hits(hits, s.rag_max_sources_in_prompt)
+    answer = _answer_from_context(question, context)
+    out = {"answer": answer, "sources": hits}
+    _remember_answer(scope, qvec, chunks, out)
+    return out
+
+
+async def aquery_rag(
+    question: str,
+    *,
+    collection_slug: str | None = None,
+    weaviate_class_name: str | None = None,
+    top_k: int | None = None,
+    metadata_filter: ChunkMetadataFilter | None = None,
+) -> dict[str, Any]:
+    """
+    Async ``query_rag`` for event-loop callers (FastAPI).
+
+    OpenAI embedding, Weaviate retrieval (shared async client) and chat calls are all
+    awaited natively. Question embeddings from concurrent calls are coalesced into one
+    request. Same arguments and return shape as ``query_rag``.
+    """
+    s = get_settings()
+    class_name, k = _resolve_target(s, collection_slug, weaviate_class_name, top_k)
+
+    # Embedding and the collection check are independent round-trips; overlap them.
+    qvec, client = await asyncio.gather(_aembed_question(question), _acollection_client(class_name))
+    hits = await _asearch_hits(s, client, question, qvec, class_name, k, metadata_filter)
+    scope = _cache_scope(class_name, k, metadata_filter)
+    chunks = _chunk_keys(hits)
+    if (cached := _cached_answer(scope, qvec, chunks)) is not None:
+        return cached
 
-    hits = _retrieve_hits(s, question, class_name, k, metadata_filter)
-    context = _context_from_hits(hits)
-    answer = _answer_from_context(s, question, context)
-    return {"answer": answer, "sources": hits}
+    context = _context_from_hits(hits, s.rag_max_sources_in_prompt)
+    answer = await _aanswer_from_context(question, context)
+    out = {"answer": answer, "sources": hits}
+    _remember_answer(scope, qvec, chunks, out)
+    return out
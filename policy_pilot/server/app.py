@@ -2,15 +2,51 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
 from typing import Any
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
 from policy_pilot import __version__
-from policy_pilot.rag.service import query_rag
+from policy_pilot.config import get_settings
+from policy_pilot.rag.service import aquery_rag, close_query_batcher
+from policy_pilot.vectordb import close_shared_async_client, get_shared_async_client
 
-app = FastAPI(title="Policy Pilot RAG", version=__version__)
+
+async def _watch_weaviate(interval: float) -> None:
+    """Probe the shared client off the request path; drop it on failure so requests reconnect."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            ready = await (await get_shared_async_client()).is_ready()
+        except Exception:
+            ready = False
+        if not ready:
+            with contextlib.suppress(Exception):
+                await close_shared_async_client()
+
+
+@contextlib.asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    watcher = asyncio.create_task(_watch_weaviate(get_settings().weaviate_health_check_seconds))
+    try:
+        yield
+    finally:
+        watcher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await watcher
+        await close_query_batcher()
+        await close_shared_async_client()
+
+
+app = FastAPI(title="Policy Pilot RAG", version=__version__, lifespan=lifespan)
+# /query responses carry full chunk texts; compress anything non-trivial.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 
 class QueryBody(BaseModel):
@@ -28,22 +64,34 @@ class QueryResponse(BaseModel):
     sources: list[dict[str, Any]]
 
 
+_HEALTH_BODY = b'{"status":"ok"}'
+
+
 @app.get("/health")
-def health() -> dict[str, str]:
-    return {"status": "ok"}
+async def health() -> Response:
+    # Static body, pre-encoded once; async so probes never wait on the threadpool.
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+# Registered once for all routes: ValueError is a client/config problem (400); anything
+# else is reported as 500 with the message, matching the former per-route handling.
+@app.exception_handler(ValueError)
+async def _value_error(_: Request, exc: ValueError) -> JSONResponse:
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+
+@app.exception_handler(Exception)
+async def _unhandled_error(_: Request, exc: Exception) -> JSONResponse:
+    return JSONResponse(status_code=500, content={"detail": str(exc)})
 
 
 @app.post("/query", response_model=QueryResponse)
-def post_query(body: QueryBody) -> QueryResponse:
-    try:
-        out = query_rag(
-            body.question,
-            collection_slug=body.collection_slug,
-            weaviate_class_name=body.weaviate_class_name,
-            top_k=body.top_k,
-        )
-        return QueryResponse(answer=out["answer"], sources=out["sources"])
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc)) from exc
+async def post_query(body: QueryBody) -> QueryResponse:
+    out = await aquery_rag(
+        body.question,
+        collection_slug=body.collection_slug,
+        weaviate_class_name=body.weaviate_class_name,
+        top_k=body.top_k,
+    )
+    # FastAPI validates against response_model when serializing; skip a second pass here.
+    return QueryResponse.model_construct(answer=out["answer"], sources=out["sources"])
@@ -1,17 +1,25 @@
 from policy_pilot.vectordb.weaviate import (
     CHUNK_METADATA_PROPERTIES,
+    close_shared_async_client,
     connect_weaviate,
+    connect_weaviate_async,
     create_chunk_collection,
     delete_collection_if_exists,
+    get_shared_async_client,
+    get_shared_client,
     library_class_name,
     list_collection_names,
 )
 
 __all__ = [
     "CHUNK_METADATA_PROPERTIES",
+    "close_shared_async_client",
     "connect_weaviate",
+    "connect_weaviate_async",
     "create_chunk_collection",
     "delete_collection_if_exists",
+    "get_shared_async_client",
+    "get_shared_client",
     "library_class_name",
     "list_collection_names",
 ]
@@ -4,7 +4,11 @@ Weaviate: client, collection naming, and chunk schema (application-supplied vect
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import re
+import threading
+from typing import Any
 
 import weaviate
 from weaviate.auth import Auth
@@ -51,16 +55,15 @@ def _grpc_endpoint(
     return host, port, secure
 
 
-def connect_weaviate(
+def _connection_kwargs(
     *,
-    http_host: str | None = None,
-    http_port: int | None = None,
-    http_secure: bool | None = None,
-    grpc_host: str | None = None,
-    grpc_port: int | None = None,
-    grpc_secure: bool | None = None,
-) -> weaviate.WeaviateClient:
-    """Sync client; explicit args override `Settings` / environment."""
+    http_host: str | None,
+    http_port: int | None,
+    http_secure: bool | None,
+    grpc_host: str | None,
+    grpc_port: int | None,
+    grpc_secure: bool | None,
+) -> dict[str, Any]:
     s = get_settings()
     h_host, h_port, h_secure = _http_endpoint(
         s, http_host=http_host, http_port=http_port, http_secure=http_secure
@@ -70,17 +73,127 @@ def connect_weaviate(
     )
     key = (s.weaviate_api_key or "").strip()
     auth = Auth.api_key(key) if key else None
+    return {
+        "http_host": h_host,
+        "http_port": h_port,
+        "http_secure": h_secure,
+        "grpc_host": g_host,
+        "grpc_port": g_port,
+        "grpc_secure": g_secure,
+        "auth_credentials": auth,
+    }
+
+
+def connect_weaviate(
+    *,
+    http_host: str | None = None,
+    http_port: int | None = None,
+    http_secure: bool | None = None,
+    grpc_host: str | None = None,
+    grpc_port: int | None = None,
+    grpc_secure: bool | None = None,
+) -> weaviate.WeaviateClient:
+    """Sync client; explicit args override `Settings` / environment."""
     return weaviate.connect_to_custom(
-        http_host=h_host,
-        http_port=h_port,
-        http_secure=h_secure,
-        grpc_host=g_host,
-        grpc_port=g_port,
-        grpc_secure=g_secure,
-        auth_credentials=auth,
+        **_connection_kwargs(
+            http_host=http_host,
+            http_port=http_port,
+            http_secure=http_secure,
+            grpc_host=grpc_host,
+            grpc_port=grpc_port,
+            grpc_secure=grpc_secure,
+        )
     )
 
 
+async def connect_weaviate_async(
+    *,
+    http_host: str | None = None,
+    http_port: int | None = None,
+    http_secure: bool | None = None,
+    grpc_host: str | None = None,
+    grpc_port: int | None = None,
+    grpc_secure: bool | None = None,
+) -> weaviate.WeaviateAsyncClient:
+    """Connected async client (for event-loop callers); same overrides as ``connect_weaviate``."""
+    client = weaviate.use_async_with_custom(
+        **_connection_kwargs(
+            http_host=http_host,
+            http_port=http_port,
+            http_secure=http_secure,
+            grpc_host=grpc_host,
+            grpc_port=grpc_port,
+            grpc_secure=grpc_secure,
+        )
+    )
+    try:
+        await client.connect()
+    except Exception:
+        with contextlib.suppress(Exception):
+            await client.close()
+        raise
+    return client
+
+
+_shared_client: weaviate.WeaviateClient | None = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client() -> weaviate.WeaviateClient:
+    """
+    Process-wide client for request paths (API, UI), connected on first use.
+
+    The fast path is a lock-free global read; the lock is only taken to connect.
+    Callers must not ``close()`` it; scripts that want a short-lived connection should
+    use ``connect_weaviate``.
+    """
+    global _shared_client
+    client = _shared_client
+    if client is not None:
+        return client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = connect_weaviate()
+        return _shared_client
+
+
+_shared_async_client: weaviate.WeaviateAsyncClient | None = None
+_shared_async_loop: asyncio.AbstractEventLoop | None = None
+_shared_async_lock: asyncio.Lock | None = None
+
+
+async def get_shared_async_client() -> weaviate.WeaviateAsyncClient:
+    """
+    Async counterpart of ``get_shared_client`` for the API server's event loop.
+
+    The client and its lock belong to the loop that created them; a call from a
+    different loop (e.g. a new ``asyncio.run``) drops them and connects afresh. Close it
+    with ``close_shared_async_client``.
+    """
+    global _shared_async_client, _shared_async_loop, _shared_async_lock
+    loop = asyncio.get_running_loop()
+    client = _shared_async_client
+    if client is not None and _shared_async_loop is loop:
+        return client
+    if _shared_async_loop is not loop or _shared_async_lock is None:
+        # The old loop's client cannot be awaited from here; let it be collected.
+        _shared_async_client = None
+        _shared_async_loop = loop
+        _shared_async_lock = asyncio.Lock()
+    async with _shared_async_lock:
+        if _shared_async_client is None:
+            _shared_async_client = await connect_weaviate_async()
+        return _shared_async_client
+
+
+async def close_shared_async_client() -> None:
+    """Close and drop the shared async client; the next getter call reconnects."""
+    global _shared_async_client
+    client, _shared_async_client = _shared_async_client, None
+    if client is not None and _shared_async_loop is asyncio.get_running_loop():
+        await client.close()
+
+
 CHUNK_METADATA_PROPERTIES: list[Property] = [
     Property(name="text", data_type=DataType.TEXT),
     Property(name="source_file", data_type=DataType.TEXT),
@@ -96,11 +209,22 @@ def delete_collection_if_exists(client: weaviate.WeaviateClient, class_name: str
         client.collections.delete(class_name)
 
 
+def _vector_quantizer(kind: str) -> Any | None:
+    if kind == "sq":
+        return Configure.VectorIndex.Quantizer.sq()
+    if kind == "bq":
+        return Configure.VectorIndex.Quantizer.bq()
+    if kind == "pq":
+        return Configure.VectorIndex.Quantizer.pq()
+    return None
+
+
 def create_chunk_collection(client: weaviate.WeaviateClient, class_name: str) -> None:
     """
     Create a chunk collection with self-provided embeddings and an HNSW vector index.
 
     Dense retrieval uses the HNSW graph for approximate nearest-neighbor search (cosine).
+    ``WEAVIATE_VECTOR_QUANTIZER`` optionally compresses the in-memory vectors (SQ/BQ/PQ).
     Recreate the collection (e.g. ingest with ``recreate_collection=True``) to apply
     changes to immutable HNSW parameters.
     """
@@ -111,6 +235,7 @@ def create_chunk_collection(client: weaviate.WeaviateClient, class_name: str) ->
                 distance_metric=VectorDistances.COSINE,
                 ef_construction=128,
                 max_connections=32,
+                quantizer=_vector_quantizer(get_settings().weaviate_vector_quantizer),
             ),
         ),
         properties=CHUNK_METADATA_PROPERTIES,
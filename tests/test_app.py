@@ -0,0 +1,55 @@
+"""HTTP layer with aquery_rag stubbed out."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from policy_pilot.server import app as app_module
+
+# Deprecations (e.g. FastAPIDeprecationWarning, a UserWarning) must not fire per request.
+pytestmark = pytest.mark.filterwarnings("error")
+
+
+@pytest.fixture
+def client():
+    with TestClient(app_module.app, raise_server_exceptions=False) as c:
+        yield c
+
+
+def test_query_returns_answer_and_sources(client, monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_aquery_rag(question: str, **kwargs: Any) -> dict[str, Any]:
+        return {"answer": f"re: {question}", "sources": [{"text": "t", "page": 1}]}
+
+    monkeypatch.setattr(app_module, "aquery_rag", fake_aquery_rag)
+    resp = client.post("/query", json={"question": "Leave?"})
+    assert resp.status_code == 200
+    assert resp.json() == {"answer": "re: Leave?", "sources": [{"text": "t", "page": 1}]}
+
+
+def test_value_error_is_400(client, monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_aquery_rag(question: str, **kwargs: Any) -> dict[str, Any]:
+        raise ValueError("Weaviate collection 'X' does not exist. Ingest a PDF first.")
+
+    monkeypatch.setattr(app_module, "aquery_rag", fake_aquery_rag)
+    resp = client.post("/query", json={"question": "Leave?"})
+    assert resp.status_code == 400
+    assert "does not exist" in resp.json()["detail"]
+
+
+def test_health(client) -> None:
+    resp = client.get("/health")
+    assert resp.status_code == 200
+    assert resp.json() == {"status": "ok"}
+
+
+def test_unexpected_error_is_500(client, monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_aquery_rag(question: str, **kwargs: Any) -> dict[str, Any]:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(app_module, "aquery_rag", fake_aquery_rag)
+    resp = client.post("/query", json={"question": "Leave?"})
+    assert resp.status_code == 500
+    assert resp.json() == {"detail": "boom"}
@@ -0,0 +1,109 @@
+"""QueryEmbeddingBatcher coalescing, error fan-out and worker lifecycle."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from policy_pilot.rag.batching import QueryEmbeddingBatcher
+
+
+class FakeEmbedder:
+    def __init__(self, *, fail: Exception | None = None, drop_last: bool = False) -> None:
+        self.calls: list[list[str]] = []
+        self.fail = fail
+        self.drop_last = drop_last
+
+    async def __call__(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        if self.fail is not None:
+            raise self.fail
+        vectors = [[float(len(t))] for t in texts]
+        return vectors[:-1] if self.drop_last else vectors
+
+
+def _batcher(embed: FakeEmbedder, **kwargs: float) -> QueryEmbeddingBatcher:
+    opts = {"max_wait_ms": 20.0, "max_tokens": 1000}
+    opts.update(kwargs)
+    return QueryEmbeddingBatcher(embed, len, **opts)  # type: ignore[arg-type]
+
+
+def test_concurrent_calls_share_one_request() -> None:
+    embed = FakeEmbedder()
+    batcher = _batcher(embed)
+
+    async def main() -> list[list[float]]:
+        out = await asyncio.gather(*(batcher.embed(t) for t in ("a", "bb", "ccc")))
+        await batcher.close()
+        return out
+
+    assert asyncio.run(main()) == [[1.0], [2.0], [3.0]]
+    assert embed.calls == [["a", "bb", "ccc"]]
+
+
+def test_token_budget_closes_batch() -> None:
+    embed = FakeEmbedder()
+    batcher = _batcher(embed, max_tokens=4)
+
+    async def main() -> None:
+        await asyncio.gather(*(batcher.embed(t) for t in ("aa", "bb", "cc")))
+        await batcher.close()
+
+    asyncio.run(main())
+    assert embed.calls == [["aa", "bb"], ["cc"]]
+
+
+def test_errors_fan_out_to_every_caller() -> None:
+    batcher = _batcher(FakeEmbedder(fail=ConnectionError("down")))
+
+    async def main() -> list[object]:
+        out = await asyncio.gather(batcher.embed("a"), batcher.embed("b"), return_exceptions=True)
+        await batcher.close()
+        return out
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, ConnectionError) for r in results)
+
+
+def test_wrong_vector_count_fails_batch_and_worker_survives() -> None:
+    embed = FakeEmbedder(drop_last=True)
+    batcher = _batcher(embed)
+
+    async def main() -> None:
+        with pytest.raises(RuntimeError, match="1 vectors for 2 texts"):
+            await asyncio.gather(batcher.embed("a"), batcher.embed("b"))
+        embed.drop_last = False
+        assert await batcher.embed("abc") == [3.0]
+        await batcher.close()
+
+    asyncio.run(main())
+
+
+def test_close_fails_in_flight_callers() -> None:
+    started = asyncio.Event()
+
+    async def hang(texts: list[str]) -> list[list[float]]:
+        started.set()
+        await asyncio.sleep(3600)
+        return []
+
+    batcher = QueryEmbeddingBatcher(hang, len, max_wait_ms=0.0, max_tokens=1000)
+
+    async def main() -> None:
+        pending = asyncio.ensure_future(batcher.embed("a"))
+        await started.wait()
+        await batcher.close()
+        with pytest.raises(RuntimeError, match="stopped"):
+            await pending
+
+    asyncio.run(main())
+
+
+def test_new_event_loop_gets_a_new_worker() -> None:
+    embed = FakeEmbedder()
+    batcher = _batcher(embed)
+
+    assert asyncio.run(batcher.embed("a")) == [1.0]
+    assert asyncio.run(batcher.embed("bb")) == [2.0]
+    assert embed.calls == [["a"], ["bb"]]
@@ -0,0 +1,123 @@
+"""SemanticAnswerCache lookups, grounding gate, expiry and eviction."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from policy_pilot.rag import cache as cache_mod
+from policy_pilot.rag.cache import SemanticAnswerCache
+
+SCOPE = ("PolicyChunk", 5, None)
+CHUNKS = frozenset({("hr.pdf", 1, 0), ("hr.pdf", 1, 1)})
+
+
+def _vec(*head: float, dim: int = 8) -> list[float]:
+    return list(head) + [0.0] * (dim - len(head))
+
+
+def _cache(**kwargs: float) -> SemanticAnswerCache:
+    opts = {"max_size": 8, "threshold": 0.95, "min_overlap": 0.5, "ttl_seconds": 60.0}
+    opts.update(kwargs)
+    return SemanticAnswerCache(**opts)  # type: ignore[arg-type]
+
+
+def test_hit_above_threshold_and_miss_below() -> None:
+    c = _cache()
+    c.put(SCOPE, _vec(1.0), CHUNKS, {"answer": "a"})
+
+    assert c.get(SCOPE, _vec(1.0, 0.05), CHUNKS) == {"answer": "a"}
+    assert c.get(SCOPE, _vec(1.0, 1.0), CHUNKS) is None
+    assert c.get(SCOPE, _vec(0.0, 1.0), CHUNKS) is None
+
+
+def test_scope_must_match() -> None:
+    c = _cache()
+    c.put(SCOPE, _vec(1.0), CHUNKS, {"answer": "a"})
+
+    assert c.get(("PolicyChunk", 3, None), _vec(1.0), CHUNKS) is None
+    assert c.get(("Other", 5, None), _vec(1.0), CHUNKS) is None
+
+
+def test_chunk_overlap_gate() -> None:
+    c = _cache(min_overlap=0.5)
+    c.put(SCOPE, _vec(1.0), CHUNKS, {"answer": "a"})
+
+    # 1 of 3 distinct chunks shared: below the gate.
+    assert c.get(SCOPE, _vec(1.0), frozenset({("hr.pdf", 1, 0), ("hr.pdf", 2, 0)})) is None
+    # 2 of 3 shared: enough.
+    assert c.get(SCOPE, _vec(1.0), CHUNKS | {("hr.pdf", 2, 0)}) == {"answer": "a"}
+
+
+def test_results_are_copied_in_and_out() -> None:
+    c = _cache()
+    result = {"answer": "a", "sources": [{"page": 1}]}
+    c.put(SCOPE, _vec(1.0), CHUNKS, result)
+    result["sources"][0]["page"] = 99
+
+    first = c.get(SCOPE, _vec(1.0), CHUNKS)
+    assert first is not None and first["sources"][0]["page"] == 1
+    first["sources"].append({"page": 2})
+    assert c.get(SCOPE, _vec(1.0), CHUNKS) == {"answer": "a", "sources": [{"page": 1}]}
+
+
+def test_entries_expire(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(cache_mod, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    c = _cache(ttl_seconds=10.0)
+    c.put(SCOPE, _vec(1.0), CHUNKS, {"answer": "a"})
+
+    now[0] = 109.0
+    assert c.get(SCOPE, _vec(1.0), CHUNKS) is not None
+    now[0] = 110.0
+    assert c.get(SCOPE, _vec(1.0), CHUNKS) is None
+    assert len(c) == 0
+
+
+def test_expired_entries_are_purged_on_put(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(cache_mod, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    c = _cache(ttl_seconds=10.0)
+    c.put(SCOPE, _vec(1.0), CHUNKS, {"answer": "a"})
+    c.put(SCOPE, _vec(0.0, 1.0), CHUNKS, {"answer": "b"})
+
+    now[0] = 111.0
+    c.put(SCOPE, _vec(0.0, 0.0, 1.0), CHUNKS, {"answer": "c"})
+
+    assert len(c) == 1
+    assert c._expiry == [(121.0, 2)]
+
+
+def test_expiry_heap_is_compacted_under_eviction() -> None:
+    c = _cache(max_size=2, ttl_seconds=3600.0)
+    for i in range(50):
+        c.put(SCOPE, _vec(*([0.0] * (i % 8)), 1.0), CHUNKS, {"answer": str(i)})
+
+    assert len(c) == 2
+    assert len(c._expiry) <= 2 * len(c)
+    assert set(c._entries) <= {entry_id for _, entry_id in c._expiry}
+
+
+def test_clock_gives_referenced_entries_a_second_chance() -> None:
+    c = _cache(max_size=2)
+    c.put(SCOPE, _vec(1.0), CHUNKS, {"answer": "a"})
+    c.put(SCOPE, _vec(0.0, 1.0), CHUNKS, {"answer": "b"})
+    # Hit "a": it is the oldest entry but now carries a reference bit.
+    assert c.get(SCOPE, _vec(1.0), CHUNKS) is not None
+
+    c.put(SCOPE, _vec(0.0, 0.0, 1.0), CHUNKS, {"answer": "c"})
+
+    assert len(c) == 2
+    assert c.get(SCOPE, _vec(0.0, 1.0), CHUNKS) is None
+    assert c.get(SCOPE, _vec(0.0, 0.0, 1.0), CHUNKS) == {"answer": "c"}
+    # "a" spent its second chance: with no new reference it is the next victim.
+    c.put(SCOPE, _vec(0.0, 0.0, 0.0, 1.0), CHUNKS, {"answer": "d"})
+    assert c.get(SCOPE, _vec(1.0), CHUNKS) is None
+
+
+def test_zero_size_disables_puts() -> None:
+    c = _cache(max_size=0)
+    c.put(SCOPE, _vec(1.0), CHUNKS, {"answer": "a"})
+
+    assert len(c) == 0
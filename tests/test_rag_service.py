@@ -0,0 +1,194 @@
+"""query_rag / aquery_rag with the embedding model, Weaviate client and chat model stubbed out."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from policy_pilot import config
+from policy_pilot.rag import service
+
+HITS = [{"text": "Leave is 20 days.", "source_file": "hr.pdf", "page": 1, "chunk_index": 0}]
+
+
+class FakeEmbeddings:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def embed_query(self, text: str) -> list[float]:
+        self.calls.append(text)
+        return [1.0, 0.0, 0.0]
+
+
+class FakeBatcher:
+    def __init__(self, embeddings: FakeEmbeddings) -> None:
+        self._embeddings = embeddings
+
+    async def embed(self, text: str) -> list[float]:
+        return self._embeddings.embed_query(text)
+
+
+class FakeChat:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def invoke(self, messages: list[Any]) -> AIMessage:
+        self.calls += 1
+        return AIMessage(content="20 days [1]")
+
+    async def ainvoke(self, messages: list[Any]) -> AIMessage:
+        return self.invoke(messages)
+
+
+@pytest.fixture
+def rag(monkeypatch: pytest.MonkeyPatch):
+    def setup(**env: str) -> SimpleNamespace:
+        monkeypatch.setenv("OPENAI_API_KEY", "test")
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        config.get_settings.cache_clear()
+        service._answer_cache.cache_clear()
+        service._embedding_cache.cache_clear()
+        service._missing_until.clear()
+
+        fakes = SimpleNamespace(
+            embeddings=FakeEmbeddings(),
+            chat=FakeChat(),
+            hits=[dict(h) for h in HITS],
+            exists=True,
+            exists_checks=[],
+            searches=[],
+        )
+
+        def exists(name: str) -> bool:
+            fakes.exists_checks.append(name)
+            return fakes.exists
+
+        async def aexists(name: str) -> bool:
+            return exists(name)
+
+        def fake_search(client: Any, class_name: str, **kwargs: Any) -> list[dict[str, Any]]:
+            fakes.searches.append(class_name)
+            return [dict(h) for h in fakes.hits]
+
+        async def fake_asearch(client: Any, class_name: str, **kwargs: Any) -> list[dict[str, Any]]:
+            return fake_search(client, class_name, **kwargs)
+
+        sync_client = SimpleNamespace(collections=SimpleNamespace(exists=exists))
+        async_client = SimpleNamespace(collections=SimpleNamespace(exists=aexists))
+
+        async def fake_get_shared_async_client() -> SimpleNamespace:
+            return async_client
+
+        monkeypatch.setattr(service, "get_embedding_model", lambda: fakes.embeddings)
+        monkeypatch.setattr(service, "_query_batcher", lambda: FakeBatcher(fakes.embeddings))
+        monkeypatch.setattr(service, "get_shared_client", lambda: sync_client)
+        monkeypatch.setattr(service, "get_shared_async_client", fake_get_shared_async_client)
+        monkeypatch.setattr(service, "search_chunks", fake_search)
+        monkeypatch.setattr(service, "asearch_chunks", fake_asearch)
+        monkeypatch.setattr(service, "_chat_model", lambda: fakes.chat)
+        return fakes
+
+    yield setup
+    config.get_settings.cache_clear()
+    service._answer_cache.cache_clear()
+    service._embedding_cache.cache_clear()
+    service._missing_until.clear()
+
+
+def _sync(question: str) -> dict[str, Any]:
+    return service.query_rag(question)
+
+
+def _async(question: str) -> dict[str, Any]:
+    return asyncio.run(service.aquery_rag(question))
+
+
+PATHS = pytest.mark.parametrize("ask", [_sync, _async], ids=["sync", "async"])
+
+
+@PATHS
+def test_answers_from_retrieved_hits(rag, ask) -> None:
+    fakes = rag()
+    out = ask("How much leave?")
+    assert out == {"answer": "20 days [1]", "sources": HITS}
+    assert fakes.embeddings.calls == ["How much leave?"]
+    assert fakes.searches == ["Policy_documents"]
+
+
+@PATHS
+def test_repeat_question_is_answered_from_cache(rag, ask) -> None:
+    fakes = rag()
+    first = ask("How much leave?")
+    second = ask("How much leave?")
+    assert second == first
+    assert fakes.chat.calls == 1
+    # Retrieval still runs: it is what the cached answer is checked against.
+    assert len(fakes.searches) == 2
+
+
+@PATHS
+def test_changed_chunks_miss_the_cache(rag, ask) -> None:
+    fakes = rag()
+    ask("How much leave?")
+    fakes.hits = [{**HITS[0], "text": "Leave is 25 days."}]
+    ask("How much leave?")
+    assert fakes.chat.calls == 2
+
+
+@PATHS
+def test_deleted_collection_is_not_served_from_cache(rag, ask) -> None:
+    fakes = rag()
+    ask("How much leave?")
+    fakes.exists = False
+    with pytest.raises(ValueError, match="does not exist"):
+        ask("How much leave?")
+    assert fakes.chat.calls == 1
+
+
+@PATHS
+def test_cache_disabled(rag, ask) -> None:
+    fakes = rag(RAG_CACHE_SIZE="0")
+    ask("How much leave?")
+    ask("How much leave?")
+    assert fakes.chat.calls == 2
+
+
+@PATHS
+def test_missing_collection_is_remembered(rag, ask) -> None:
+    fakes = rag()
+    fakes.exists = False
+    for _ in range(2):
+        with pytest.raises(ValueError, match="does not exist"):
+            ask("How much leave?")
+    assert fakes.exists_checks == ["Policy_documents"]
+    assert fakes.searches == []
+
+
+@PATHS
+def test_existing_collection_is_checked_every_time(rag, ask) -> None:
+    fakes = rag()
+    ask("How much leave?")
+    ask("How much leave?")
+    assert fakes.exists_checks == ["Policy_documents", "Policy_documents"]
+
+
+@PATHS
+def test_repeat_question_reuses_embedding(rag, ask) -> None:
+    fakes = rag(RAG_CACHE_SIZE="0")
+    ask("How much leave?")
+    ask("How much leave?")
+    assert fakes.embeddings.calls == ["How much leave?"]
+    assert len(fakes.searches) == 2
+
+
+@PATHS
+def test_without_embedding_cache(rag, ask) -> None:
+    fakes = rag(RAG_EMBEDDING_CACHE_SIZE="0", RAG_CACHE_SIZE="0")
+    ask("How much leave?")
+    ask("How much leave?")
+    assert fakes.embeddings.calls == ["How much leave?", "How much leave?"]
@@ -0,0 +1,71 @@
+"""Weaviate connection helpers with the client factory stubbed out."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from policy_pilot.vectordb import weaviate as vdb
+
+
+class FakeAsyncClient:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.fail = fail
+        self.closed = False
+
+    async def connect(self) -> None:
+        if self.fail:
+            raise ConnectionError("weaviate is down")
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def shared_async(monkeypatch: pytest.MonkeyPatch) -> list[FakeAsyncClient]:
+    created: list[FakeAsyncClient] = []
+
+    def fake_use_async_with_custom(**kwargs: Any) -> FakeAsyncClient:
+        created.append(FakeAsyncClient())
+        return created[-1]
+
+    monkeypatch.setattr(vdb.weaviate, "use_async_with_custom", fake_use_async_with_custom)
+    monkeypatch.setattr(vdb, "_shared_async_client", None)
+    monkeypatch.setattr(vdb, "_shared_async_loop", None)
+    monkeypatch.setattr(vdb, "_shared_async_lock", None)
+    return created
+
+
+def test_connect_weaviate_async_closes_client_on_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = FakeAsyncClient(fail=True)
+
+    def fake_use_async_with_custom(**kwargs: Any) -> FakeAsyncClient:
+        return client
+
+    monkeypatch.setattr(vdb.weaviate, "use_async_with_custom", fake_use_async_with_custom)
+    with pytest.raises(ConnectionError):
+        asyncio.run(vdb.connect_weaviate_async())
+    assert client.closed
+
+
+def test_shared_async_client_is_reused_within_a_loop(shared_async: list[FakeAsyncClient]) -> None:
+    async def main() -> None:
+        first, second = await asyncio.gather(
+            vdb.get_shared_async_client(), vdb.get_shared_async_client()
+        )
+        assert first is second
+        await vdb.close_shared_async_client()
+        assert first.closed
+
+    asyncio.run(main())
+    assert len(shared_async) == 1
+
+
+def test_shared_async_client_reconnects_on_a_new_loop(shared_async: list[FakeAsyncClient]) -> None:
+    first = asyncio.run(vdb.get_shared_async_client())
+    second = asyncio.run(vdb.get_shared_async_client())
+
+    assert first is not second
+    assert len(shared_async) == 2